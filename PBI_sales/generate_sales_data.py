@@ -1,48 +1,181 @@
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from faker import Faker
-import uuid
-
-# Initialize Faker
-fake = Faker()
-Faker.seed(64648)
-np.random.seed(64649)
-
-
-def generate_customer_data(num_customers=100):
-    """Generate customer dimension table"""
+import argparse
+from collections import Counter
+from contextlib import ExitStack
+from concurrent.futures import ProcessPoolExecutor
+
+# Base seed; main() derives an independent seed for each generated dataset from it.
+# The generators themselves default to seed=None, which draws different data per call
+SEED = 64649
+
+# Customers per Faker worker when generating large customer tables
+FAKER_CHUNK_SIZE = 5000
+
+# Sales rows generated and written at a time, bounds memory for large runs
+SALES_CHUNK_SIZE = 100000
+
+# Sales rows (--transactions) needed before the Numba kernel beats NumPy for derived
+# fields. It saves about 15ns/row but importing numba and loading the cached kernel
+# costs ~0.4s
+NUMBA_MIN_TRANSACTIONS = 30000000
+
+# Share of sales rows flagged with each injected data quality issue
+SALES_ISSUE_RATES = {
+    'has_error': 0.1,  # quantity may be zero or negative
+    'missing_date': 0.02,
+    'missing_customer': 0.02,
+    'missing_price': 0.02,
+    'missing_cost': 0.05,
+    'has_discount': 0.2
+}
+
+# Output stream buffer, so large tables go to disk in few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _fake_customer_chunk(seed, is_company):
+    """Generate name, email and phone columns for one chunk of customers"""
+    # Each chunk gets its own seeded Faker so results don't depend on worker scheduling
+    chunk_fake = Faker()
+    chunk_fake.seed_instance(seed)
+    company, name, email, phone = (chunk_fake.company, chunk_fake.name,
+                                   chunk_fake.email, chunk_fake.phone_number)
+    names = [company() if c else name() for c in is_company]
+    emails = [email() for _ in range(len(is_company))]
+    phones = [phone() for _ in range(len(is_company))]
+    return names, emails, phones
+
+
+def _compute_derived_numpy(quantity, unit_price, discount, unit_cost, missing_price, missing_cost):
+    """Compute SalesAmount, Cost and Profit, leaving NaN where inputs are missing"""
+    valid = ~missing_price
+    sales_amount = np.full(len(quantity), np.nan)
+    sales_amount[valid] = quantity[valid] * unit_price[valid] - discount[valid]
+
+    valid &= ~missing_cost
+    cost = np.full(len(quantity), np.nan)
+    cost[valid] = unit_cost[valid] * quantity[valid]
+    return sales_amount, cost, sales_amount - cost
+
+
+def _compute_derived_loop(quantity, unit_price, discount, unit_cost, missing_price, missing_cost):
+    """Single-pass version of _compute_derived_numpy, compiled with Numba"""
+    n = len(quantity)
+    sales_amount = np.empty(n)
+    cost = np.empty(n)
+    profit = np.empty(n)
+    for i in range(n):
+        if missing_price[i]:
+            sales_amount[i] = np.nan
+            cost[i] = np.nan
+        else:
+            sales_amount[i] = quantity[i] * unit_price[i] - discount[i]
+            cost[i] = np.nan if missing_cost[i] else unit_cost[i] * quantity[i]
+        profit[i] = sales_amount[i] - cost[i]
+    return sales_amount, cost, profit
+
+
+def _derived_fields_kernel(num_transactions):
+    """Pick the derived-field implementation for a sales run of the given size"""
+    if num_transactions < NUMBA_MIN_TRANSACTIONS:
+        return _compute_derived_numpy
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional, large runs fall back to NumPy too
+        return _compute_derived_numpy
+    return njit(cache=True)(_compute_derived_loop)
+
+
+def _categorical_choice(rng, categories, size):
+    """Draw size values from categories as a pandas Categorical"""
+    # Same draws as rng.choice, but stored as small integer codes instead of strings
+    return pd.Categorical.from_codes(rng.integers(0, len(categories), size=size), categories)
+
+
+def _to_arrow_table(df):
+    """Convert a DataFrame to an Arrow table, with datetime columns as plain dates"""
+    table = pa.Table.from_pandas(df, preserve_index=False).replace_schema_metadata(None)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+    return table
+
+
+def _open_writers(stack, name, schema, formats):
+    """Open a buffered Arrow writer for name in each requested output format, closed by stack"""
+    writers = []
+    for output_format in formats:
+        sink = stack.enter_context(pa.output_stream(f'{name}.{output_format}', buffer_size=WRITE_BUFFER_SIZE))
+        if output_format == 'csv':
+            writer = pacsv.CSVWriter(sink, schema)
+        else:
+            writer = pq.ParquetWriter(sink, schema, compression='snappy')
+        writers.append(stack.enter_context(writer))
+    return writers
+
+
+def write_dataset(df, name, formats=('csv',)):
+    """Write a DataFrame to name.csv and/or name.parquet"""
+    table = _to_arrow_table(df)
+    with ExitStack() as stack:
+        for writer in _open_writers(stack, name, table.schema, formats):
+            writer.write_table(table)
+
+
+def generate_customer_data(num_customers=100, seed=None):
+    """Generate customer dimension table (unseeded when seed is None)"""
+    rng = np.random.default_rng(seed)
     segments = ['Consumer', 'Corporate', 'Small Business', 'Enterprise']
     regions = ['North', 'South', 'East', 'West', 'Central']
     countries = ['United States', 'Canada', 'United Kingdom', 'Germany', 'France',
                  'Spain', 'Italy', 'Australia', 'Japan', 'Brazil']
 
-    customers = []
-    for i in range(1, num_customers + 1):
-        customer = {
-            'CustomerID': i,
-            'CustomerName': fake.company() if random.random() > 0.5 else fake.name(),
-            'Country': random.choice(countries),
-            'Region': random.choice(regions),
-            'Segment': random.choice(segments),
-            'JoinDate': fake.date_between(start_date='-2y', end_date='today'),
-            'CreditLimit': random.choice([1000, 2000, 5000, 10000, 20000, 50000]),
-            'PreferredPayment': random.choice(['Credit Card', 'Bank Transfer', 'PayPal']),
-            'Email': fake.email(),
-            'Phone': fake.phone_number()
-        }
-        customers.append(customer)
-
-    df = pd.DataFrame(customers)
+    credit_limits = np.array([1000, 2000, 5000, 10000, 20000, 50000])
+    n = num_customers
+
+    # Faker calls are unavoidable Python, so they run per chunk (in parallel for
+    # large tables); everything else is drawn as whole columns
+    is_company = rng.random(n) > 0.5
+    chunks = [is_company[start:start + FAKER_CHUNK_SIZE] for start in range(0, n, FAKER_CHUNK_SIZE)]
+    seeds = rng.integers(0, 2**32, size=len(chunks)).tolist()
+    if len(chunks) > 1:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_fake_customer_chunk, seeds, chunks))
+    else:
+        results = [_fake_customer_chunk(seed, chunk) for seed, chunk in zip(seeds, chunks)]
+    names = [value for chunk_names, _, _ in results for value in chunk_names]
+    emails = [value for _, chunk_emails, _ in results for value in chunk_emails]
+    phones = [value for _, _, chunk_phones in results for value in chunk_phones]
+    join_dates = pd.Timestamp.today().normalize() - pd.to_timedelta(rng.integers(0, 731, size=n), unit='D')
+
+    df = pd.DataFrame({
+        'CustomerID': np.arange(1, n + 1),
+        'CustomerName': names,
+        'Country': _categorical_choice(rng, countries, n),
+        'Region': _categorical_choice(rng, regions, n),
+        'Segment': _categorical_choice(rng, segments, n),
+        'JoinDate': join_dates,
+        'CreditLimit': credit_limits[rng.integers(0, len(credit_limits), size=n)],
+        'PreferredPayment': _categorical_choice(rng, ['Credit Card', 'Bank Transfer', 'PayPal'], n),
+        'Email': emails,
+        'Phone': phones
+    }, copy=False)
     # Introduce some missing values
-    df.loc[np.random.choice(df.index, size=5), 'Email'] = None
-    df.loc[np.random.choice(df.index, size=5), 'Phone'] = None
+    df.iloc[rng.choice(len(df), size=min(5, len(df)), replace=False), df.columns.get_loc('Email')] = None
+    df.iloc[rng.choice(len(df), size=min(5, len(df)), replace=False), df.columns.get_loc('Phone')] = None
     return df
 
 
-def generate_product_data(num_products=80):
-    """Generate product dimension table"""
+def generate_product_data(num_products=80, seed=None):
+    """Generate product dimension table (unseeded when seed is None)"""
+    rng = np.random.default_rng(seed)
+    fake = Faker()
+    fake.seed_instance(seed)
     categories = ['Electronics', 'Furniture', 'Office Supplies', 'Software', 'Hardware']
     subcategories = {
         'Electronics': ['Phones', 'Laptops', 'Tablets', 'Monitors', 'Accessories'],
@@ -52,29 +185,33 @@ def generate_product_data(num_products=80):
         'Hardware': ['Processors', 'Memory', 'Storage', 'Peripherals', 'Networking']
     }
 
-    products = []
-    for i in range(1, num_products + 1):
-        category = random.choice(categories)
-        product = {
-            'ProductID': i,
-            'ProductName': fake.catch_phrase(),
-            'Category': category,
-            'SubCategory': random.choice(subcategories[category]),
-            'UnitPrice': round(random.uniform(10, 2000), 2),
-            'Cost': 0,  # Will be calculated later
-            'Weight': round(random.uniform(0.1, 50), 2),
-            'StockLevel': random.randint(0, 500),
-            'ReorderPoint': random.randint(10, 100),
-            'MinimumOrderQuantity': random.randint(1, 10)
-        }
-        # Set cost as percentage of price
-        product['Cost'] = round(product['UnitPrice'] * random.uniform(0.4, 0.7), 2)
-        products.append(product)
-
-    df = pd.DataFrame(products)
+    n = num_products
+
+    # Subcategories flattened in category order, so each category's subcategory
+    # is a gather at its offset plus a per-product draw
+    subcategory_counts = np.array([len(subcategories[c]) for c in categories])
+    subcategory_offsets = np.cumsum(subcategory_counts) - subcategory_counts
+    all_subcategories = np.array([sub for c in categories for sub in subcategories[c]])
+
+    category_codes = rng.integers(0, len(categories), size=n)
+    subcategory_idx = rng.integers(0, subcategory_counts[category_codes])
+    unit_prices = np.round(rng.uniform(10, 2000, size=n), 2)
+
+    df = pd.DataFrame({
+        'ProductID': np.arange(1, n + 1),
+        'ProductName': [fake.catch_phrase() for _ in range(n)],
+        'Category': pd.Categorical.from_codes(category_codes, categories),
+        'SubCategory': pd.Categorical(all_subcategories[subcategory_offsets[category_codes] + subcategory_idx]),
+        'UnitPrice': unit_prices,
+        'Cost': np.round(unit_prices * rng.uniform(0.4, 0.7, size=n), 2),  # Cost as percentage of price
+        'Weight': np.round(rng.uniform(0.1, 50, size=n), 2),
+        'StockLevel': rng.integers(0, 501, size=n),
+        'ReorderPoint': rng.integers(10, 101, size=n),
+        'MinimumOrderQuantity': rng.integers(1, 11, size=n)
+    }, copy=False)
     # Introduce some data issues
-    df.loc[np.random.choice(df.index, size=3), 'UnitPrice'] = 0  # Invalid prices
-    df.loc[np.random.choice(df.index, size=3), 'Cost'] = None  # Missing costs
+    df.iloc[rng.choice(len(df), size=min(3, len(df)), replace=False), df.columns.get_loc('UnitPrice')] = 0  # Invalid prices
+    df.iloc[rng.choice(len(df), size=min(3, len(df)), replace=False), df.columns.get_loc('Cost')] = None  # Missing costs
     return df
 
 
@@ -82,130 +219,170 @@ def generate_date_dimension(start_date='2022-01-01', end_date='2024-12-31'):
     """Generate date dimension table"""
     dates = pd.date_range(start=start_date, end=end_date)
 
-    date_dimension = []
-    for date in dates:
-        record = {
-            'DateKey': int(date.strftime('%Y%m%d')),
-            'Date': date,
-            'Year': date.year,
-            'Quarter': (date.month - 1) // 3 + 1,
-            'Month': date.month,
-            'MonthName': date.strftime('%B'),
-            'WeekDay': date.weekday() + 1,
-            'WeekDayName': date.strftime('%A'),
-            'IsWeekend': 1 if date.weekday() >= 5 else 0,
-            'IsHoliday': 0,  # Could be enhanced with actual holiday data
-            'FiscalYear': date.year if date.month < 7 else date.year + 1,
-            'FiscalQuarter': (date.month - 1) // 3 + 1
-        }
-        date_dimension.append(record)
-
-    return pd.DataFrame(date_dimension)
-
-
-def generate_sales_data(customers_df, products_df, date_df, num_transactions=20000):
-    """Generate sales fact table with intentional data quality issues"""
-    sales = []
-    order_id = 1001
-
-    # Get valid IDs
-    customer_ids = customers_df['CustomerID'].tolist()
-    product_ids = products_df['ProductID'].tolist()
-    dates = date_df['Date'].tolist()
-
-    for _ in range(num_transactions):
-        # Introduce random data quality issues
-        has_error = random.random() < 0.1  # 10% chance of having an error
-
-        order_date = random.choice(dates)
-        product_id = random.choice(product_ids)
-        product = products_df[products_df['ProductID'] == product_id].iloc[0]
-
-        sale = {
-            'SalesOrderID': order_id,
-            'OrderDate': order_date if random.random() > 0.02 else None,  # 2% missing dates
-            'CustomerID': random.choice(customer_ids) if random.random() > 0.02 else None,  # 2% missing customers
-            'ProductID': product_id,
-            'Quantity': random.randint(-5, 20) if has_error else random.randint(1, 10),
-            'UnitPrice': product['UnitPrice'] if random.random() > 0.02 else None,
-            'DiscountAmount': round(random.uniform(0, product['UnitPrice'] * 0.3), 2) if random.random() > 0.8 else 0,
-            'ShipDate': order_date + timedelta(days=random.randint(1, 7)),
-            'ShipMode': random.choice(['Standard', 'Express', 'Next Day']),
-            'SalesPersonID': random.randint(1, 10)
-        }
-
-        # Calculate derived fields (with potential errors)
-        try:
-            if all(x is not None for x in [sale['Quantity'], sale['UnitPrice']]):
-                sale['SalesAmount'] = sale['Quantity'] * sale['UnitPrice'] - sale['DiscountAmount']
-                sale['Cost'] = product['Cost'] * sale['Quantity'] if random.random() > 0.05 else None
-                sale['Profit'] = sale['SalesAmount'] - sale['Cost'] if sale['Cost'] is not None else None
-            else:
-                sale['SalesAmount'] = None
-                sale['Cost'] = None
-                sale['Profit'] = None
-        except:
-            sale['SalesAmount'] = None
-            sale['Cost'] = None
-            sale['Profit'] = None
-
-        sales.append(sale)
-        order_id += 1
-
-    return pd.DataFrame(sales)
-
-
-def generate_quality_metrics(sales_df):
-    """Generate data quality metrics"""
-    quality_metrics = []
-    dates = pd.date_range(start='2022-01-01', end='2024-12-31', freq='D')
-
-    for date in dates:
-        daily_data = sales_df[sales_df['OrderDate'].dt.date == date.date()]
-
-        metric = {
-            'Date': date,
-            'TotalRecords': len(daily_data),
-            'MissingData': len(daily_data[daily_data.isnull().any(axis=1)]),
-            'InvalidQuantities': len(daily_data[daily_data['Quantity'] <= 0]),
-            'HighDiscounts': len(daily_data[daily_data['DiscountAmount'] > daily_data['SalesAmount'] * 0.5]),
-            'DataQualityScore': random.uniform(0.9, 1.0)  # Simplified score calculation
-        }
-        quality_metrics.append(metric)
-
-    return pd.DataFrame(quality_metrics)
-
-
-def main():
-    """Generate all datasets and save to CSV"""
-    print("Generating customer data...")
-    customers_df = generate_customer_data()
-    customers_df.to_csv('dim_customer.csv', index=False)
-
-    print("Generating product data...")
-    products_df = generate_product_data()
-    products_df.to_csv('dim_product.csv', index=False)
-
-    print("Generating date dimension...")
+    quarter = (dates.month - 1) // 3 + 1
+
+    return pd.DataFrame({
+        'DateKey': dates.year * 10000 + dates.month * 100 + dates.day,
+        'Date': dates,
+        'Year': dates.year,
+        'Quarter': quarter,
+        'Month': dates.month,
+        'MonthName': dates.month_name(),
+        'WeekDay': dates.weekday + 1,
+        'WeekDayName': dates.day_name(),
+        'IsWeekend': (dates.weekday >= 5).astype(int),
+        'IsHoliday': 0,  # Could be enhanced with actual holiday data
+        'FiscalYear': np.where(dates.month < 7, dates.year, dates.year + 1),
+        'FiscalQuarter': quarter
+    }, copy=False)
+
+
+def generate_sales_data(customers_df, products_df, date_df, num_transactions=20000, seed=None,
+                        chunk_size=SALES_CHUNK_SIZE):
+    """Yield sales fact table chunks with intentional data quality issues (unseeded when seed is None)"""
+    rng = np.random.default_rng(seed)
+
+    # Get valid IDs and product attributes as arrays for positional lookups
+    customer_ids = customers_df['CustomerID'].to_numpy()
+    dates = date_df['Date'].to_numpy()
+    product_ids = products_df['ProductID'].to_numpy()
+    unit_prices = products_df['UnitPrice'].to_numpy()
+    costs = products_df['Cost'].to_numpy()
+    compute_derived = _derived_fields_kernel(num_transactions)
+    issue_rates = np.array(list(SALES_ISSUE_RATES.values()))[:, np.newaxis]
+
+    for start in range(0, num_transactions, chunk_size):
+        n = min(chunk_size, num_transactions - start)
+
+        # Introduce random data quality issues, all flags come from one uniform draw
+        flags = dict(zip(SALES_ISSUE_RATES, rng.random((len(issue_rates), n)) < issue_rates))
+
+        order_dates = dates[rng.integers(0, len(dates), size=n)]
+        product_idx = rng.integers(0, len(product_ids), size=n)
+        unit_price = unit_prices[product_idx]
+        quantity = np.where(flags['has_error'], rng.integers(-5, 21, size=n), rng.integers(1, 11, size=n))
+        discount = np.where(flags['has_discount'], np.round(rng.uniform(0, unit_price * 0.3), 2), 0.0)
+        ship_dates = order_dates + rng.integers(1, 8, size=n).astype('timedelta64[D]')
+        order_dates[flags['missing_date']] = np.datetime64('NaT')
+
+        # Calculate derived fields, missing inputs propagate as NaN
+        sales_amount, cost, profit = compute_derived(
+            quantity, unit_price, discount, costs[product_idx], flags['missing_price'], flags['missing_cost']
+        )
+
+        # Every column is a freshly drawn array, so pandas can wrap them without copying
+        yield pd.DataFrame({
+            'SalesOrderID': np.arange(1001 + start, 1001 + start + n),
+            'OrderDate': order_dates,
+            'CustomerID': np.where(flags['missing_customer'], np.nan,
+                                   customer_ids[rng.integers(0, len(customer_ids), size=n)]),
+            'ProductID': product_ids[product_idx],
+            'Quantity': quantity,
+            'UnitPrice': np.where(flags['missing_price'], np.nan, unit_price),
+            'DiscountAmount': discount,
+            'ShipDate': ship_dates,
+            'ShipMode': _categorical_choice(rng, ['Standard', 'Express', 'Next Day'], n),
+            'SalesPersonID': rng.integers(1, 11, size=n),
+            'SalesAmount': sales_amount,
+            'Cost': cost,
+            'Profit': profit
+        }, copy=False)
+
+
+def flag_quality_issues(sales_df):
+    """Flag data quality issues on each row of a chunk of sales"""
+    return pd.DataFrame({
+        'MissingData': sales_df.isnull().any(axis=1),
+        'InvalidQuantities': sales_df['Quantity'] <= 0,
+        'HighDiscounts': sales_df['DiscountAmount'] > sales_df['SalesAmount'] * 0.5
+    })
+
+
+def count_quality_issues(sales_df, issues):
+    """Count the flags from flag_quality_issues per order day"""
+    # Single groupby pass over the chunk instead of filtering it once per day
+    daily = issues.groupby(sales_df['OrderDate'].dt.floor('D'))
+    return daily.sum().assign(TotalRecords=daily.size())
+
+
+def generate_quality_metrics(daily_counts, date_df, seed=None):
+    """Generate data quality metrics from count_quality_issues chunk counts (unseeded when seed is None)"""
+    rng = np.random.default_rng(seed)
+
+    # One row per day of the date dimension, including days without sales (or no sales at all)
+    if daily_counts:
+        metrics = pd.concat(daily_counts).groupby(level=0).sum()
+    else:
+        metrics = pd.DataFrame(columns=['MissingData', 'InvalidQuantities', 'HighDiscounts', 'TotalRecords'],
+                               dtype='int64')
+    metrics = metrics.reindex(date_df['Date'], fill_value=0).reset_index()
+
+    return metrics[['Date', 'TotalRecords', 'MissingData', 'InvalidQuantities', 'HighDiscounts']].assign(
+        DataQualityScore=rng.uniform(0.9, 1.0, size=len(metrics))  # Simplified score calculation
+    )
+
+
+def main(formats=('csv',), num_customers=100, num_products=80, num_transactions=20000):
+    """Generate all datasets and save them in the given output formats"""
+    # Distinct seeds keep each dataset reproducible and independent of the others
+    customer_seed, product_seed, sales_seed, quality_seed = np.random.SeedSequence(SEED).generate_state(4).tolist()
+
+    # Large customer tables already spread their Faker work over a process pool; the
+    # product and date dimensions are too cheap to be worth one of their own
+    print("Generating customer, product and date dimensions...")
+    customers_df = generate_customer_data(num_customers, seed=customer_seed)
+    products_df = generate_product_data(num_products, seed=product_seed)
     date_df = generate_date_dimension()
-    date_df.to_csv('dim_date.csv', index=False)
 
+    write_dataset(customers_df, 'dim_customer', formats)
+    write_dataset(products_df, 'dim_product', formats)
+    write_dataset(date_df, 'dim_date', formats)
+
+    # Sales are streamed to disk chunk by chunk, only the issue counts are kept
     print("Generating sales data...")
-    sales_df = generate_sales_data(customers_df, products_df, date_df)
-    sales_df.to_csv('fact_sales.csv', index=False)
+    daily_counts = []
+    summary = Counter(dict.fromkeys(['Total Sales Records', 'Records with Missing Data', 'Invalid Quantities',
+                                     'Missing Costs', 'High Discounts'], 0))
+    with ExitStack() as stack:
+        sales_writers = None
+        for sales_chunk in generate_sales_data(customers_df, products_df, date_df, num_transactions,
+                                               seed=sales_seed):
+            sales_table = _to_arrow_table(sales_chunk)
+            if sales_writers is None:
+                sales_writers = _open_writers(stack, 'fact_sales', sales_table.schema, formats)
+            for writer in sales_writers:
+                writer.write_table(sales_table)
+
+            # Row flags are computed once and shared by the daily metrics and the summary
+            issues = flag_quality_issues(sales_chunk)
+            daily_counts.append(count_quality_issues(sales_chunk, issues))
+            issue_totals = issues.sum()
+
+            summary['Total Sales Records'] += len(sales_chunk)
+            summary['Records with Missing Data'] += issue_totals['MissingData']
+            summary['Invalid Quantities'] += issue_totals['InvalidQuantities']
+            summary['Missing Costs'] += sales_chunk['Cost'].isnull().sum()
+            summary['High Discounts'] += issue_totals['HighDiscounts']
 
     print("Generating quality metrics...")
-    quality_df = generate_quality_metrics(sales_df)
-    quality_df.to_csv('data_quality_metrics.csv', index=False)
+    quality_df = generate_quality_metrics(daily_counts, date_df, seed=quality_seed)
+    write_dataset(quality_df, 'data_quality_metrics', formats)
 
     # Generate summary of data quality issues
     print("\nData Quality Summary:")
-    print(f"Total Sales Records: {len(sales_df)}")
-    print(f"Records with Missing Data: {len(sales_df[sales_df.isnull().any(axis=1)])}")
-    print(f"Invalid Quantities: {len(sales_df[sales_df['Quantity'] <= 0])}")
-    print(f"Missing Costs: {len(sales_df[sales_df['Cost'].isnull()])}")
-    print(f"High Discounts: {len(sales_df[sales_df['DiscountAmount'] > sales_df['SalesAmount'] * 0.5])}")
+    for label, count in summary.items():
+        print(f"{label}: {count}")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the sample sales datasets")
+    parser.add_argument('--format', choices=['csv', 'parquet', 'both'], default='csv',
+                        help="output file format; Parquet uses Snappy compression (default: csv)")
+    parser.add_argument('--customers', type=int, default=100, help="number of customers (default: 100)")
+    parser.add_argument('--products', type=int, default=80, help="number of products (default: 80)")
+    parser.add_argument('--transactions', type=int, default=20000,
+                        help="number of sales transactions, written in chunks of %d rows (default: 20000)"
+                             % SALES_CHUNK_SIZE)
+    args = parser.parse_args()
+    main(('csv', 'parquet') if args.format == 'both' else (args.format,),
+         num_customers=args.customers, num_products=args.products, num_transactions=args.transactions)